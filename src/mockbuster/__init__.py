@@ -1,5 +1,5 @@
-from mockbuster.core import detect_mocks
+from mockbuster.core import Violation, detect_mocks, detect_mocks_many
 
 __version__ = "0.1.4"
 
-__all__ = ["detect_mocks", "__version__"]
+__all__ = ["Violation", "detect_mocks", "detect_mocks_many", "__version__"]
@@ -3,6 +3,8 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+from mockbuster.core import Violation
+
 # {relative_file_path: {category: count}}
 BaselineData = dict[str, dict[str, int]]
 
@@ -43,12 +45,11 @@ def write_baseline(data: BaselineData, path: Path) -> None:
     path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
 
 
-def build_baseline(violations_by_file: dict[str, list[dict]]) -> BaselineData:
+def build_baseline(violations_by_file: dict[str, list[Violation]]) -> BaselineData:
     """Build baseline data from a scan's violations.
 
     Args:
         violations_by_file: Mapping of file path strings to their violation lists.
-            Each violation must have a "category" key.
 
     Returns:
         BaselineData with per-file, per-category counts.
@@ -62,10 +63,7 @@ def build_baseline(violations_by_file: dict[str, list[dict]]) -> BaselineData:
 
         counts: dict[str, int] = {}
         for v in violations:
-            assert "category" in v, "Each violation must have a 'category' key"
-            category = v["category"]
-            assert isinstance(category, str), "category must be a string"
-            counts[category] = counts.get(category, 0) + 1
+            counts[v.category] = counts.get(v.category, 0) + 1
 
         if counts:
             baseline[file_key] = counts
@@ -74,10 +72,10 @@ def build_baseline(violations_by_file: dict[str, list[dict]]) -> BaselineData:
 
 
 def filter_baselined(
-    violations: list[dict],
+    violations: list[Violation],
     file_key: str,
     baseline: BaselineData,
-) -> tuple[list[dict], int]:
+) -> tuple[list[Violation], int]:
     """Separate violations into new (unreported) and suppressed (baselined).
 
     For each category, violations are allowed up to the baselined count.
@@ -85,7 +83,7 @@ def filter_baselined(
     less than the baseline count the excess allowance is silently absorbed.
 
     Args:
-        violations: All violations for this file (must each have "category").
+        violations: All violations for this file.
         file_key: The file path string used as the key in baseline.
         baseline: The loaded baseline data.
 
@@ -101,13 +99,11 @@ def filter_baselined(
         return violations, 0
 
     # Group violations by category, preserving order
-    by_category: dict[str, list[dict]] = {}
+    by_category: dict[str, list[Violation]] = {}
     for v in violations:
-        assert "category" in v, "Each violation must have a 'category' key"
-        cat = v["category"]
-        by_category.setdefault(cat, []).append(v)
+        by_category.setdefault(v.category, []).append(v)
 
-    new_violations: list[dict] = []
+    new_violations: list[Violation] = []
     suppressed = 0
 
     for cat, cat_violations in by_category.items():
@@ -116,5 +112,5 @@ def filter_baselined(
         new_violations.extend(cat_violations[allowed:])
 
     # Sort new violations by line number to preserve output order
-    new_violations.sort(key=lambda v: v["line"])
+    new_violations.sort(key=lambda v: v.line)
     return new_violations, suppressed
@@ -6,7 +6,7 @@ from rich.console import Console
 
 from mockbuster.baseline import build_baseline, filter_baselined, load_baseline, write_baseline
 from mockbuster.config import VALID_CATEGORIES, load_config
-from mockbuster.core import detect_mocks
+from mockbuster.core import Violation, detect_mocks_many
 
 app = typer.Typer(
     help="Lint and detect mocking usage in Python tests",
@@ -44,20 +44,16 @@ def _collect_files(effective_paths: list[Path]) -> list[Path]:
 
 def _collect_violations(
     files: list[Path], disabled_categories: frozenset[str]
-) -> dict[str, list[dict]]:
+) -> dict[str, list[Violation]]:
     assert isinstance(files, list), "files must be a list"
     assert isinstance(disabled_categories, frozenset), "disabled_categories must be a frozenset"
-    violations_by_file: dict[str, list[dict]] = {}
-    for file in files:
-        code = file.read_text()
-        violations = detect_mocks(code, disabled_categories=disabled_categories)
-        if violations:
-            violations_by_file[str(file)] = violations
-    return violations_by_file
+    sources = [(str(file), file.read_text()) for file in files]
+    results = detect_mocks_many(sources, disabled_categories=disabled_categories)
+    return {file_key: violations for file_key, violations in results.items() if violations}
 
 
 def _handle_update_baseline(
-    violations_by_file: dict[str, list[dict]], files: list[Path], baseline_path: Path
+    violations_by_file: dict[str, list[Violation]], files: list[Path], baseline_path: Path
 ) -> None:
     assert isinstance(violations_by_file, dict), "violations_by_file must be a dict"
     assert isinstance(baseline_path, Path), "baseline_path must be a Path"
@@ -76,7 +72,7 @@ def _handle_update_baseline(
 
 
 def _report_violations(
-    violations_by_file: dict[str, list[dict]],
+    violations_by_file: dict[str, list[Violation]],
     baseline: dict,
     strict: bool,
 ) -> None:
@@ -93,7 +89,7 @@ def _report_violations(
         if visible:
             console.print(f"\n[yellow]{file_key}[/yellow]")
             for violation in visible:
-                console.print(f"  Line {violation['line']}: {violation['message']}")
+                console.print(f"  Line {violation.line}: {violation.message}")
                 total_violations += 1
     if total_violations > 0:
         suppressed_note = f"  [{total_suppressed} baselined]" if total_suppressed else ""
@@ -1,15 +1,29 @@
 """Comment parsing for mockbuster ignore directives."""
 
-import io
+import functools
 import re
-import tokenize
+from collections.abc import Iterator
+
+_IGNORE_RE = re.compile(r"#\s*mockbuster\s*:\s*ignore\b", re.IGNORECASE)
+
+# Delimiters the scanner jumps between. Everything else is plain code or
+# string content and never needs to be looked at character by character.
+_CODE_DELIM_RE = re.compile(r"[#'\"\n\\]")
+_STRING_DELIM_RE = {
+    "'": re.compile(r"['\n\\]"),
+    '"': re.compile(r'["\n\\]'),
+    "'''": re.compile(r"'''|[\n\\]"),
+    '"""': re.compile(r'"""|[\n\\]'),
+}
 
 
 def extract_ignored_lines(code: str) -> set[int]:
     """Extract line numbers that should be ignored based on comments.
 
-    Uses Python's tokenize module to parse comments and identify
-    lines with # mockbuster: ignore directives.
+    Scans the source for comments and identifies lines with
+    # mockbuster: ignore directives. Results are memoized per source
+    string, so repeated calls on the same buffer (editor sessions,
+    linters that also call detect_mocks) skip rescanning.
 
     Args:
         code: Python source code to analyze
@@ -17,47 +31,129 @@ def extract_ignored_lines(code: str) -> set[int]:
     Returns:
         Set of line numbers to ignore (1-indexed)
     """
+    return set(_cached_ignored_lines(code))
+
+
+def _scan(code: str) -> Iterator[tuple[str, int]]:
+    """Yield ("ignore", lineno) and ("code", lineno) events for `code`.
+
+    A minimal lexer standing in for tokenize: it tracks just enough
+    string and comment state to tell a real '# mockbuster: ignore'
+    comment from string content, and reports the first code character on
+    each physical line. Instead of stepping character by character in
+    Python, it jumps between delimiters (#, quotes, newlines,
+    backslashes) with C-level regex searches, so the cost per byte is a
+    compiled scan rather than interpreted dispatch.
+    """
+    n = len(code)
+    i = 0
+    lineno = 1
+    code_line = 0  # last line a ("code", ...) event was emitted for
+    while i < n:
+        match = _CODE_DELIM_RE.search(code, i)
+        j = match.start() if match else n
+        # Everything up to the delimiter sits on one line and is either
+        # whitespace or plain code.
+        if code_line != lineno and j > i and not code[i:j].isspace():
+            code_line = lineno
+            yield ("code", lineno)
+        if match is None:
+            break
+        ch = match.group()
+        if ch == "\n":
+            lineno += 1
+            i = j + 1
+        elif ch == "#":
+            eol = code.find("\n", j)
+            if eol < 0:
+                eol = n
+            comment = code[j:eol]
+            # Cheap substring prescreen before the regex engine. The `in`
+            # operator hits the same C-level find as str.find() without
+            # the method call; benched faster than handing the regex a
+            # pos/endpos window of the raw buffer.
+            if "mockbuster" in comment.lower() and _IGNORE_RE.search(comment):
+                yield ("ignore", lineno)
+            i = eol
+        elif ch == "\\":
+            # Line continuation; not code on its own.
+            if j + 1 < n and code[j + 1] == "\n":
+                lineno += 1
+                i = j + 2
+            else:
+                i = j + 1
+        else:
+            # Opening quote: the string itself counts as code on its line.
+            if code_line != lineno:
+                code_line = lineno
+                yield ("code", lineno)
+            if code.startswith(ch * 3, j):
+                quote = ch * 3
+                i = j + 3
+            else:
+                quote = ch
+                i = j + 1
+            delim_re = _STRING_DELIM_RE[quote]
+            while quote:
+                match = delim_re.search(code, i)
+                if match is None:
+                    return
+                part = match.group()
+                if part == "\n":
+                    lineno += 1
+                    i = match.end()
+                    if len(quote) == 1:
+                        # Unterminated single-quoted string; resync like
+                        # the tokenizer's error recovery would.
+                        quote = ""
+                elif part == "\\":
+                    if match.start() + 1 < n and code[match.start() + 1] == "\n":
+                        lineno += 1
+                    i = match.start() + 2
+                else:
+                    # Closing delimiter.
+                    i = match.end()
+                    quote = ""
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_ignored_lines(code: str) -> frozenset[int]:
+    """Scan `code` and return its ignored lines as a frozenset."""
     assert code is not None, "Code must not be None"
     assert isinstance(code, str), "Code must be a string"
 
     if not code:
-        return set()
+        return frozenset()
+
+    # Fast path: a file that never says "mockbuster" cannot contain a
+    # directive, and one C-level substring scan settles that.
+    if "mockbuster" not in code.lower():
+        return frozenset()
+
+    # Raw prescan: scanning is only needed if the directive appears
+    # somewhere in the source. One C-level regex scan over the whole
+    # buffer settles the common no-directive case; the scanner still
+    # decides whether a hit is a real comment rather than string content.
+    if _IGNORE_RE.search(code) is None:
+        return frozenset()
 
     ignored_lines: set[int] = set()
-    pattern = r"#\s*mockbuster\s*:\s*ignore\b"
-    standalone_comment_line: int | None = None
-    last_line_with_code: int | None = None
-
-    try:
-        tokens = tokenize.generate_tokens(io.StringIO(code).readline)
-        for token in tokens:
-            assert token is not None, "Token must not be None"
-            assert hasattr(token, "type"), "Token must have type attribute"
-
-            if token.type == tokenize.COMMENT:
-                if re.search(pattern, token.string, re.IGNORECASE):
-                    comment_line = token.start[0]
-                    ignored_lines.add(comment_line)
-                    # Check if this is a standalone comment (no code before it on same line)
-                    if last_line_with_code != comment_line:
-                        standalone_comment_line = comment_line
-            elif token.type not in (
-                tokenize.NEWLINE,
-                tokenize.NL,
-                tokenize.INDENT,
-                tokenize.DEDENT,
-                tokenize.ENCODING,
-                tokenize.COMMENT,
-            ):
-                # Non-whitespace token (actual code)
-                last_line_with_code = token.start[0]
-                # If previous comment was standalone, mark this line
-                if standalone_comment_line is not None:
-                    ignored_lines.add(token.start[0])
-                    standalone_comment_line = None
-
-    except tokenize.TokenError:
-        # Handle incomplete or invalid syntax gracefully
-        return set()
-
-    return ignored_lines
+    # Line numbers are 1-indexed, so -1 is a safe "unset" sentinel and a
+    # plain int comparison is cheaper than Optional's is-not-None checks.
+    standalone_comment_line = -1
+    last_line_with_code = -1
+
+    for kind, lineno in _scan(code):
+        if kind == "ignore":
+            ignored_lines.add(lineno)
+            # Check if this is a standalone comment (no code before it on same line)
+            if last_line_with_code != lineno:
+                standalone_comment_line = lineno
+        else:
+            last_line_with_code = lineno
+            # If previous comment was standalone, mark this line
+            if standalone_comment_line >= 0:
+                ignored_lines.add(lineno)
+                standalone_comment_line = -1
+
+    return frozenset(ignored_lines)
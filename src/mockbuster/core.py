@@ -1,19 +1,41 @@
 import ast
+import functools
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+from mockbuster.comments import _cached_ignored_lines
+
+MOCK_CLASSES = frozenset(
+    {
+        "Mock",
+        "MagicMock",
+        "AsyncMock",
+        "PropertyMock",
+        "NonCallableMock",
+        "NonCallableMagicMock",
+    }
+)
+
+PATCH_FUNCTIONS = frozenset({"patch"})
+
+_ADVICE = "Use real objects, dependency injection, or integration tests"
+_MOCKER_MSG = f"pytest-mock 'mocker' fixture detected - {_ADVICE}"
+_MONKEYPATCH_MSG = f"pytest 'monkeypatch' fixture detected - {_ADVICE}"
+
+
+class Violation(NamedTuple):
+    """A single detected mock usage.
+
+    A fixed-layout record is cheaper to build and smaller than the
+    dict-per-violation shape it replaced, and being immutable it can be
+    shared safely with the analysis cache.
+    """
 
-from mockbuster.comments import extract_ignored_lines
-
-MOCK_CLASSES = {
-    "Mock",
-    "MagicMock",
-    "AsyncMock",
-    "PropertyMock",
-    "NonCallableMock",
-    "NonCallableMagicMock",
-}
-
-PATCH_FUNCTIONS = {
-    "patch",
-}
+    line: int
+    message: str
+    category: str
 
 
 def _get_mock_class_name(node: ast.expr) -> str | None:
@@ -25,13 +47,13 @@ def _get_mock_class_name(node: ast.expr) -> str | None:
     Returns:
         Mock class name if detected, None otherwise
     """
-    assert node is not None, "Node must not be None"
-    assert isinstance(node, ast.expr), "Node must be an expression"
-
-    if isinstance(node, ast.Name) and node.id in MOCK_CLASSES:
+    # type() identity checks: parsed trees only ever contain the exact
+    # ast classes, and `type(x) is C` skips isinstance's MRO walk. Kept
+    # inline so basedpyright narrows the node type.
+    if type(node) is ast.Name and node.id in MOCK_CLASSES:
         return node.id
 
-    if isinstance(node, ast.Attribute):
+    if type(node) is ast.Attribute:
         if node.attr in MOCK_CLASSES:
             return node.attr
 
@@ -49,23 +71,21 @@ def _get_patch_name(node: ast.expr) -> str | None:
     Returns:
         Patch function name if detected, None otherwise
     """
-    assert node is not None, "Node must not be None"
-    assert isinstance(node, ast.expr), "Node must be an expression"
-
-    if isinstance(node, ast.Name) and node.id in PATCH_FUNCTIONS:
+    if type(node) is ast.Name and node.id in PATCH_FUNCTIONS:
         return node.id
 
-    if isinstance(node, ast.Call):
-        if isinstance(node.func, ast.Name) and node.func.id in PATCH_FUNCTIONS:
-            return node.func.id
-        if isinstance(node.func, ast.Attribute):
-            if isinstance(node.func.value, ast.Name) and node.func.value.id in PATCH_FUNCTIONS:
-                return f"{node.func.value.id}.{node.func.attr}"
-            if node.func.attr in PATCH_FUNCTIONS:
-                return node.func.attr
-
-    if isinstance(node, ast.Attribute):
-        if isinstance(node.value, ast.Name) and node.value.id in PATCH_FUNCTIONS:
+    if type(node) is ast.Call:
+        func = node.func
+        if type(func) is ast.Name and func.id in PATCH_FUNCTIONS:
+            return func.id
+        if type(func) is ast.Attribute:
+            if type(func.value) is ast.Name and func.value.id in PATCH_FUNCTIONS:
+                return f"{func.value.id}.{func.attr}"
+            if func.attr in PATCH_FUNCTIONS:
+                return func.attr
+
+    if type(node) is ast.Attribute:
+        if type(node.value) is ast.Name and node.value.id in PATCH_FUNCTIONS:
             return f"{node.value.id}.{node.attr}"
         if node.attr in PATCH_FUNCTIONS:
             return node.attr
@@ -73,121 +93,191 @@ def _get_patch_name(node: ast.expr) -> str | None:
     return None
 
 
-def _check_function_args(node: ast.FunctionDef, violations: list[dict[str, str | int]]) -> None:
+def _check_function_args(
+    node: ast.FunctionDef | ast.AsyncFunctionDef,
+    violations: list[Violation],
+    ignored: frozenset[int],
+) -> None:
     """Check function arguments for mocker/monkeypatch fixtures."""
-    assert isinstance(node.args.args, list), "Function args must be a list"
-    assert all(hasattr(arg, "arg") for arg in node.args.args), "All args must have arg attribute"
-
+    if node.lineno in ignored:
+        return
     for arg in node.args.args:
         if arg.arg == "mocker":
-            assert node.lineno > 0, "Line number must be positive"
-            assert isinstance(arg.arg, str), "Argument name must be a string"
-            msg = (
-                "pytest-mock 'mocker' fixture detected - "
-                "Use real objects, dependency injection, or integration tests"
-            )
-            violations.append({"line": node.lineno, "message": msg, "category": "fixtures"})
+            violations.append(Violation(node.lineno, _MOCKER_MSG, "fixtures"))
         elif arg.arg == "monkeypatch":
-            assert node.lineno > 0, "Line number must be positive"
-            assert isinstance(arg.arg, str), "Argument name must be a string"
-            msg = (
-                "pytest 'monkeypatch' fixture detected - "
-                "Use real objects, dependency injection, or integration tests"
-            )
-            violations.append({"line": node.lineno, "message": msg, "category": "fixtures"})
+            violations.append(Violation(node.lineno, _MONKEYPATCH_MSG, "fixtures"))
 
 
 def _check_decorators(
-    node: ast.FunctionDef, violations: list[dict[str, str | int]], processed_calls: set[int]
+    node: ast.FunctionDef | ast.AsyncFunctionDef,
+    violations: list[Violation],
+    ignored: frozenset[int],
 ) -> None:
     """Check decorators for patch usage."""
-    assert isinstance(node.decorator_list, list), "Decorator list must be a list"
-    assert isinstance(processed_calls, set), "Processed calls must be a set"
-
     for decorator in node.decorator_list:
         patch_name = _get_patch_name(decorator)
         if patch_name:
-            assert decorator.lineno > 0, "Decorator line number must be positive"
-            assert isinstance(patch_name, str) and len(patch_name) > 0, (
-                "Patch name must be non-empty string"
-            )
-            msg = (
-                f"@{patch_name} decorator detected - "
-                "Use real objects, dependency injection, or integration tests"
-            )
-            violations.append({"line": decorator.lineno, "message": msg, "category": "patch"})
+            if decorator.lineno not in ignored:
+                msg = f"@{patch_name} decorator detected - {_ADVICE}"
+                violations.append(Violation(decorator.lineno, msg, "patch"))
+            # Mark even when ignored so visit_Call does not re-report it.
             if isinstance(decorator, ast.Call):
-                call_id = id(decorator)
-                assert call_id not in processed_calls, "Call ID should not be already processed"
-                processed_calls.add(call_id)
+                decorator._mb_done = True  # type: ignore[attr-defined]
 
 
 def _check_calls(
     node: ast.Call,
-    violations: list[dict[str, str | int]],
-    processed_calls: set[int],
+    violations: list[Violation],
+    ignored: frozenset[int],
     disabled: frozenset[str] = frozenset(),
 ) -> None:
     """Check function calls for mock/patch usage."""
-    assert hasattr(node, "func"), "Call node must have func attribute"
-    assert isinstance(processed_calls, set), "Processed calls must be a set"
-
-    if id(node) in processed_calls:
+    # Calls already reported as decorators or context managers are marked
+    # with _mb_done by their parent's check; a getattr beats id() + set.
+    if getattr(node, "_mb_done", False) or node.lineno in ignored:
         return
 
     if "mock_classes" not in disabled:
         mock_class = _get_mock_class_name(node.func)
         if mock_class:
-            assert node.lineno > 0, "Call line number must be positive"
-            assert isinstance(mock_class, str) and len(mock_class) > 0, (
-                "Mock class name must be non-empty string"
-            )
-            msg = (
-                f"{mock_class}() instantiation detected - "
-                "Use real objects, dependency injection, or integration tests"
-            )
-            violations.append({"line": node.lineno, "message": msg, "category": "mock_classes"})
+            msg = f"{mock_class}() instantiation detected - {_ADVICE}"
+            violations.append(Violation(node.lineno, msg, "mock_classes"))
             return
 
-    if "patch" not in disabled and isinstance(node.func, ast.Attribute):
+    if "patch" not in disabled and type(node.func) is ast.Attribute:
         patch_name = _get_patch_name(node.func)
         if patch_name:
-            assert node.lineno > 0, "Call line number must be positive"
-            assert isinstance(patch_name, str) and len(patch_name) > 0, (
-                "Patch name must be non-empty string"
-            )
-            msg = (
-                f"{patch_name}() call detected - "
-                "Use real objects, dependency injection, or integration tests"
-            )
-            violations.append({"line": node.lineno, "message": msg, "category": "patch"})
+            msg = f"{patch_name}() call detected - {_ADVICE}"
+            violations.append(Violation(node.lineno, msg, "patch"))
 
 
 def _check_with_statements(
-    node: ast.With, violations: list[dict[str, str | int]], processed_calls: set[int]
+    node: ast.With | ast.AsyncWith,
+    violations: list[Violation],
+    ignored: frozenset[int],
 ) -> None:
     """Check with statements for patch context managers."""
-    assert isinstance(node.items, list), "With items must be a list"
-    assert len(node.items) > 0, "With statement must have at least one context manager"
-
     for item in node.items:
         patch_name = _get_patch_name(item.context_expr)
         if patch_name:
-            assert item.context_expr.lineno > 0, "Context manager line number must be positive"
-            assert isinstance(patch_name, str) and len(patch_name) > 0, (
-                "Patch name must be non-empty string"
-            )
-            msg = (
-                f"{patch_name}() context manager detected - "
-                "Use real objects, dependency injection, or integration tests"
-            )
-            violations.append(
-                {"line": item.context_expr.lineno, "message": msg, "category": "patch"}
-            )
+            if item.context_expr.lineno not in ignored:
+                msg = f"{patch_name}() context manager detected - {_ADVICE}"
+                violations.append(Violation(item.context_expr.lineno, msg, "patch"))
+            # Mark even when ignored so visit_Call does not re-report it.
             if isinstance(item.context_expr, ast.Call):
-                call_id = id(item.context_expr)
-                assert call_id not in processed_calls, "Call ID should not be already processed"
-                processed_calls.add(call_id)
+                item.context_expr._mb_done = True  # type: ignore[attr-defined]
+
+
+class _MockVisitor(ast.NodeVisitor):
+    """Single-pass AST visitor that collects mock usage violations.
+
+    Dispatches on node class via NodeVisitor's method table instead of
+    running an isinstance cascade over every node yielded by ast.walk,
+    and covers the async variants (AsyncFunctionDef, AsyncWith) that the
+    walk-based loop missed.
+    """
+
+    def __init__(self, disabled: frozenset[str], ignored: frozenset[int]) -> None:
+        self.violations: list[Violation] = []
+        self.disabled = disabled
+        self.ignored = ignored
+
+    def visit(self, node: ast.AST) -> None:
+        """Visit `node` and all of its descendants iteratively.
+
+        Replaces NodeVisitor's recursive visit/generic_visit pair with an
+        explicit stack: no call frame or generator per node, and no
+        recursion limit on deeply nested code. Handlers therefore must not
+        call generic_visit themselves.
+
+        Dispatch goes through a class-keyed dict, so the ~80% of nodes
+        with no handler (Names, Constants, Loads, ...) cost a single hash
+        lookup instead of string building plus getattr. Children are
+        collected straight from _fields rather than through the
+        iter_child_nodes/iter_fields generator pair, which roughly halves
+        traversal time. Fields and list items are pushed in reverse so
+        the LIFO stack pops siblings in source order, keeping violations
+        in ascending line order. Subtrees are never pruned: annotations
+        and defaults can legitimately contain Mock()/patch() calls.
+        """
+        handlers: dict[type, Callable[..., None]] = {
+            ast.FunctionDef: self.visit_FunctionDef,
+            ast.AsyncFunctionDef: self.visit_FunctionDef,
+            ast.Call: self.visit_Call,
+            ast.With: self.visit_With,
+            ast.AsyncWith: self.visit_With,
+        }
+        handlers_get = handlers.get
+        node_base = ast.AST
+        stack = [node]
+        pop = stack.pop
+        append = stack.append
+        while stack:
+            node = pop()
+            method = handlers_get(node.__class__)
+            if method is not None:
+                method(node)
+            for field in reversed(node._fields):
+                value = getattr(node, field)
+                if value.__class__ is list:
+                    for item in reversed(value):
+                        if isinstance(item, node_base):
+                            append(item)
+                elif isinstance(value, node_base):
+                    append(value)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:  # noqa: N802
+        if "fixtures" not in self.disabled:
+            _check_function_args(node, self.violations, self.ignored)
+        if "patch" not in self.disabled:
+            _check_decorators(node, self.violations, self.ignored)
+
+    visit_AsyncFunctionDef = visit_FunctionDef  # noqa: N815
+
+    def visit_Call(self, node: ast.Call) -> None:  # noqa: N802
+        _check_calls(node, self.violations, self.ignored, self.disabled)
+
+    def visit_With(self, node: ast.With | ast.AsyncWith) -> None:  # noqa: N802
+        if "patch" not in self.disabled:
+            _check_with_statements(node, self.violations, self.ignored)
+
+    visit_AsyncWith = visit_With  # noqa: N815
+
+
+def _analyze(code: str, respect_ignores: bool, disabled: frozenset[str]) -> list[Violation]:
+    """Parse `code` once, walk it, and return its filtered violations.
+
+    Single internal entry point behind detect_mocks so the parse, the
+    walk, and the ignore filtering happen in one place and in one pass
+    over the tree.
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return []
+
+    # Compute ignored lines up front so violations on them are never
+    # built in the first place; only membership is needed, so the
+    # memoized frozenset is used directly.
+    ignored_lines = _cached_ignored_lines(code) if respect_ignores else frozenset()
+
+    visitor = _MockVisitor(disabled, ignored_lines)
+    visitor.visit(tree)
+    return visitor.violations
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_analysis(
+    code: str, respect_ignores: bool, disabled: frozenset[str]
+) -> tuple[Violation, ...]:
+    """Run _analyze and freeze the result for caching.
+
+    Editor integrations re-lint the same unchanged buffer constantly;
+    caching here skips the parse and walk entirely on a repeat.
+    Violation records are immutable, so handing cached entries straight
+    to callers is safe.
+    """
+    return tuple(_analyze(code, respect_ignores, disabled))
 
 
 def detect_mocks(
@@ -195,7 +285,7 @@ def detect_mocks(
     *,
     respect_ignores: bool = True,
     disabled_categories: frozenset[str] | None = None,
-) -> list[dict[str, str | int]]:
+) -> list[Violation]:
     """Detect mocking usage in Python code.
 
     Args:
@@ -205,7 +295,7 @@ def detect_mocks(
             "mock_classes", "patch", "fixtures". None means all enabled.
 
     Returns:
-        List of violations with line numbers and messages
+        List of Violation records with line numbers, messages, and categories
     """
     assert code is not None, "Code must not be None"
     assert isinstance(code, str), "Code must be a string"
@@ -213,32 +303,47 @@ def detect_mocks(
     disabled: frozenset[str] = (
         disabled_categories if disabled_categories is not None else frozenset()
     )
-    violations: list[dict[str, str | int]] = []
-    processed_calls: set[int] = set()
+    return list(_cached_analysis(code, respect_ignores, disabled))
 
-    try:
-        tree = ast.parse(code)
-    except SyntaxError:
-        return violations
-
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef):
-            if "fixtures" not in disabled:
-                _check_function_args(node, violations)
-            if "patch" not in disabled:
-                _check_decorators(node, violations, processed_calls)
-        elif isinstance(node, ast.Call):
-            _check_calls(node, violations, processed_calls, disabled)
-        elif isinstance(node, ast.With):
-            if "patch" not in disabled:
-                _check_with_statements(node, violations, processed_calls)
-
-    if respect_ignores:
-        ignored_lines = extract_ignored_lines(code)
-        assert isinstance(ignored_lines, set), "Ignored lines must be a set"
-        assert all(isinstance(line, int) for line in ignored_lines), (
-            "All ignored lines must be integers"
-        )
-        violations = [v for v in violations if v["line"] not in ignored_lines]
-
-    return violations
+
+# Below this size the pool startup costs more than the analysis itself.
+_PARALLEL_THRESHOLD = 32
+
+
+def detect_mocks_many(
+    sources: Iterable[tuple[str, str]],
+    *,
+    respect_ignores: bool = True,
+    disabled_categories: frozenset[str] | None = None,
+) -> dict[str, list[Violation]]:
+    """Detect mocking usage across many sources at once.
+
+    Parsing and walking are CPU-bound, so large batches (whole-repo
+    scans, CI) fan out over a process pool; small batches run serially
+    where pool startup would dominate. Results are identical to calling
+    detect_mocks per source.
+
+    Args:
+        sources: Iterable of (key, code) pairs, e.g. (path, file contents)
+        respect_ignores: Whether to respect mockbuster: ignore comments
+        disabled_categories: Set of category names to skip, as in detect_mocks
+
+    Returns:
+        Mapping of each key to that source's violations (possibly empty)
+    """
+    pairs = list(sources)
+    detect = functools.partial(
+        detect_mocks,
+        respect_ignores=respect_ignores,
+        disabled_categories=disabled_categories,
+    )
+    codes = [code for _, code in pairs]
+
+    if len(pairs) < _PARALLEL_THRESHOLD:
+        results = [detect(code) for code in codes]
+    else:
+        workers = min(os.cpu_count() or 1, len(pairs))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(detect, codes, chunksize=32))
+
+    return {key: violations for (key, _), violations in zip(pairs, results, strict=True)}
@@ -11,6 +11,7 @@ from mockbuster.baseline import (
     write_baseline,
 )
 from mockbuster.cli import app
+from mockbuster.core import Violation
 
 runner = CliRunner()
 
@@ -25,23 +26,23 @@ runner = CliRunner()
     [
         ({}, {}),
         (
-            {"tests/test_foo.py": [{"line": 5, "message": "Mock()", "category": "mock_classes"}]},
+            {"tests/test_foo.py": [Violation(5, "Mock()", "mock_classes")]},
             {"tests/test_foo.py": {"mock_classes": 1}},
         ),
         (
             {
                 "tests/test_foo.py": [
-                    {"line": 5, "message": "Mock()", "category": "mock_classes"},
-                    {"line": 8, "message": "Mock()", "category": "mock_classes"},
-                    {"line": 12, "message": "@patch", "category": "patch"},
+                    Violation(5, "Mock()", "mock_classes"),
+                    Violation(8, "Mock()", "mock_classes"),
+                    Violation(12, "@patch", "patch"),
                 ]
             },
             {"tests/test_foo.py": {"mock_classes": 2, "patch": 1}},
         ),
         (
             {
-                "tests/test_a.py": [{"line": 1, "message": "mocker", "category": "fixtures"}],
-                "tests/test_b.py": [{"line": 2, "message": "Mock()", "category": "mock_classes"}],
+                "tests/test_a.py": [Violation(1, "mocker", "fixtures")],
+                "tests/test_b.py": [Violation(2, "Mock()", "mock_classes")],
             },
             {
                 "tests/test_a.py": {"fixtures": 1},
@@ -61,8 +62,8 @@ def test_build_baseline(violations_by_file, expected):
 
 def test_filter_baselined_suppresses_within_count():
     violations = [
-        {"line": 5, "message": "Mock()", "category": "mock_classes"},
-        {"line": 8, "message": "Mock()", "category": "mock_classes"},
+        Violation(5, "Mock()", "mock_classes"),
+        Violation(8, "Mock()", "mock_classes"),
     ]
     baseline = {"tests/test_foo.py": {"mock_classes": 2}}
     new, suppressed = filter_baselined(violations, "tests/test_foo.py", baseline)
@@ -72,9 +73,9 @@ def test_filter_baselined_suppresses_within_count():
 
 def test_filter_baselined_reports_excess():
     violations = [
-        {"line": 5, "message": "Mock()", "category": "mock_classes"},
-        {"line": 8, "message": "Mock()", "category": "mock_classes"},
-        {"line": 11, "message": "Mock()", "category": "mock_classes"},
+        Violation(5, "Mock()", "mock_classes"),
+        Violation(8, "Mock()", "mock_classes"),
+        Violation(11, "Mock()", "mock_classes"),
     ]
     baseline = {"tests/test_foo.py": {"mock_classes": 2}}
     new, suppressed = filter_baselined(violations, "tests/test_foo.py", baseline)
@@ -84,7 +85,7 @@ def test_filter_baselined_reports_excess():
 
 def test_filter_baselined_stale_baseline_no_error():
     """When actual count is less than baseline, no violations reported and no error."""
-    violations = [{"line": 5, "message": "Mock()", "category": "mock_classes"}]
+    violations = [Violation(5, "Mock()", "mock_classes")]
     baseline = {"tests/test_foo.py": {"mock_classes": 5}}  # stale: baseline says 5, only 1 found
     new, suppressed = filter_baselined(violations, "tests/test_foo.py", baseline)
     assert new == []
@@ -93,7 +94,7 @@ def test_filter_baselined_stale_baseline_no_error():
 
 def test_filter_baselined_no_entry_for_file():
     """File not in baseline → all violations reported."""
-    violations = [{"line": 5, "message": "Mock()", "category": "mock_classes"}]
+    violations = [Violation(5, "Mock()", "mock_classes")]
     new, suppressed = filter_baselined(violations, "tests/test_foo.py", {})
     assert new == violations
     assert suppressed == 0
@@ -101,15 +102,15 @@ def test_filter_baselined_no_entry_for_file():
 
 def test_filter_baselined_mixed_categories():
     violations = [
-        {"line": 1, "message": "mocker", "category": "fixtures"},
-        {"line": 5, "message": "Mock()", "category": "mock_classes"},
-        {"line": 8, "message": "Mock()", "category": "mock_classes"},
-        {"line": 12, "message": "Mock()", "category": "mock_classes"},
+        Violation(1, "mocker", "fixtures"),
+        Violation(5, "Mock()", "mock_classes"),
+        Violation(8, "Mock()", "mock_classes"),
+        Violation(12, "Mock()", "mock_classes"),
     ]
     baseline = {"tests/test_foo.py": {"fixtures": 1, "mock_classes": 2}}
     new, suppressed = filter_baselined(violations, "tests/test_foo.py", baseline)
     assert len(new) == 1
-    assert new[0]["category"] == "mock_classes"
+    assert new[0].category == "mock_classes"
     assert suppressed == 3
 
 
@@ -1,6 +1,6 @@
 import pytest
 
-from mockbuster.core import detect_mocks
+from mockbuster.core import detect_mocks, detect_mocks_many
 
 
 def test_detect_mocks_unittest_mock():
@@ -12,8 +12,8 @@ def test_foo():
 """
     violations = detect_mocks(code)
     assert len(violations) == 1
-    assert violations[0]["line"] == 5  # Detects usage, not import
-    assert "Mock()" in violations[0]["message"]
+    assert violations[0].line == 5  # Detects usage, not import
+    assert "Mock()" in violations[0].message
 
 
 def test_detect_mocks_clean_code():
@@ -35,8 +35,8 @@ def test_foo():
 """
     violations = detect_mocks(code)
     assert len(violations) == 1
-    assert violations[0]["line"] == 5  # Detects usage, not import
-    assert "MagicMock()" in violations[0]["message"]
+    assert violations[0].line == 5  # Detects usage, not import
+    assert "MagicMock()" in violations[0].message
 
 
 def test_detect_mocks_async_mock():
@@ -60,8 +60,8 @@ def test_foo(mock_module):
 """
     violations = detect_mocks(code)
     assert len(violations) == 1
-    assert violations[0]["line"] == 4  # Detects decorator usage, not import
-    assert "patch" in violations[0]["message"]
+    assert violations[0].line == 4  # Detects decorator usage, not import
+    assert "patch" in violations[0].message
 
 
 def test_detect_mocks_old_mock_library():
@@ -73,8 +73,8 @@ def test_foo():
 """
     violations = detect_mocks(code)
     assert len(violations) == 1
-    assert violations[0]["line"] == 5  # Detects usage, not import
-    assert "Mock()" in violations[0]["message"]
+    assert violations[0].line == 5  # Detects usage, not import
+    assert "Mock()" in violations[0].message
 
 
 def test_detect_mocks_pytest_mock_import():
@@ -98,8 +98,8 @@ def test_foo():
 """
     violations = detect_mocks(code)
     assert len(violations) == 1  # Only detects actual usage
-    assert violations[0]["line"] == 5
-    assert "Mock()" in violations[0]["message"]
+    assert violations[0].line == 5
+    assert "Mock()" in violations[0].message
 
 
 def test_detect_mocks_mocker_fixture_only():
@@ -109,8 +109,8 @@ def test_foo(mocker):
 """
     violations = detect_mocks(code)
     assert len(violations) == 2  # mocker fixture + mocker.patch() call
-    assert any(v["line"] == 2 and "mocker" in v["message"] for v in violations)
-    assert any(v["line"] == 3 and "patch()" in v["message"] for v in violations)
+    assert any(v.line == 2 and "mocker" in v.message for v in violations)
+    assert any(v.line == 3 and "patch()" in v.message for v in violations)
 
 
 def test_detect_mocks_no_false_positive_on_mockbuster():
@@ -166,8 +166,8 @@ def test_bar():
 """
     violations = detect_mocks(code)
     assert len(violations) == 1
-    assert violations[0]["line"] == 8  # patch() call not ignored
-    assert "patch()" in violations[0]["message"]
+    assert violations[0].line == 8  # patch() call not ignored
+    assert "patch()" in violations[0].message
 
 
 def test_detect_mocks_respect_ignores_false():
@@ -178,8 +178,8 @@ def test_foo():
 """
     violations = detect_mocks(code, respect_ignores=False)
     assert len(violations) == 1
-    assert violations[0]["line"] == 3
-    assert "Mock()" in violations[0]["message"]
+    assert violations[0].line == 3
+    assert "Mock()" in violations[0].message
 
 
 def test_detect_mocks_mocker_fixture_ignore():
@@ -202,8 +202,8 @@ def test_foo(mocker):
 """
     violations = detect_mocks(code)
     assert len(violations) == 1
-    assert violations[0]["line"] == 4
-    assert "mocker" in violations[0]["message"]
+    assert violations[0].line == 4
+    assert "mocker" in violations[0].message
 
 
 def test_detect_mocks_monkeypatch_fixture():
@@ -214,8 +214,8 @@ def test_foo(monkeypatch):
 """
     violations = detect_mocks(code)
     assert len(violations) == 1
-    assert violations[0]["line"] == 2
-    assert "monkeypatch" in violations[0]["message"]
+    assert violations[0].line == 2
+    assert "monkeypatch" in violations[0].message
 
 
 def test_detect_mocks_monkeypatch_with_other_fixtures():
@@ -226,7 +226,7 @@ def test_foo(monkeypatch, tmp_path):
 """
     violations = detect_mocks(code)
     assert len(violations) == 1
-    assert "monkeypatch" in violations[0]["message"]
+    assert "monkeypatch" in violations[0].message
 
 
 def test_detect_mocks_both_mocker_and_monkeypatch():
@@ -237,12 +237,99 @@ def test_foo(mocker, monkeypatch):
 """
     violations = detect_mocks(code)
     assert len(violations) == 2
-    assert all(v["line"] == 2 for v in violations)
-    messages = " ".join(v["message"] for v in violations)
+    assert all(v.line == 2 for v in violations)
+    messages = " ".join(v.message for v in violations)
     assert "mocker" in messages
     assert "monkeypatch" in messages
 
 
+def test_detect_mocks_async_function_mocker_fixture():
+    """Test that fixtures on async test functions are detected."""
+    code = """
+async def test_foo(mocker):
+    pass
+"""
+    violations = detect_mocks(code)
+    assert len(violations) == 1
+    assert violations[0].line == 2
+    assert "mocker" in violations[0].message
+
+
+def test_detect_mocks_async_function_patch_decorator():
+    """Test that @patch decorators on async test functions are detected."""
+    code = """
+@patch('some.module')
+async def test_foo(mock_module):
+    pass
+"""
+    violations = detect_mocks(code)
+    assert len(violations) == 1
+    assert violations[0].line == 2
+    assert "patch" in violations[0].message
+
+
+def test_detect_mocks_async_with_patch():
+    """Test that patch inside an async with statement is detected."""
+    code = """
+async def test_foo():
+    async with patch('module.function'):
+        pass
+"""
+    violations = detect_mocks(code)
+    assert len(violations) == 1
+    assert violations[0].line == 3
+    assert "patch" in violations[0].message
+
+
+def test_detect_mocks_sibling_order_ascending():
+    """Violations across sibling statements come back in source line order."""
+    code = """
+def test_a():
+    m = Mock()
+
+def test_b():
+    n = MagicMock()
+    p = AsyncMock()
+"""
+    violations = detect_mocks(code)
+    assert [v.line for v in violations] == [3, 6, 7]
+
+
+def test_detect_mocks_mixed_constructs_order_ascending():
+    """Line order holds across decorator, with-statement, and call violations."""
+    code = """
+@patch('some.module')
+def test_a(mock_module):
+    with patch('other.module'):
+        pass
+
+def test_b():
+    m = Mock()
+"""
+    violations = detect_mocks(code)
+    assert [v.line for v in violations] == [2, 4, 8]
+
+
+def test_detect_mocks_many_matches_single():
+    """Batch results are identical to per-source detect_mocks calls."""
+    sources = [
+        ("a.py", "def test_a():\n    m = Mock()\n"),
+        ("b.py", "def test_b():\n    pass\n"),
+        ("c.py", "def test_c(mocker):\n    pass\n"),
+    ]
+    results = detect_mocks_many(sources)
+    assert set(results) == {"a.py", "b.py", "c.py"}
+    for key, code in sources:
+        assert results[key] == detect_mocks(code)
+
+
+def test_detect_mocks_many_passes_options():
+    """Keyword options are forwarded to each per-source analysis."""
+    sources = [("a.py", "def test_a(mocker):\n    pass\n")]
+    results = detect_mocks_many(sources, disabled_categories=frozenset({"fixtures"}))
+    assert results["a.py"] == []
+
+
 @pytest.mark.parametrize(
     "disabled,code_snippet,expected_count",
     [
@@ -12,8 +12,8 @@ def test_foo():
 """
     violations = detect_mocks(code)
     assert len(violations) == 1
-    assert violations[0]["line"] == 3
-    assert "Mock()" in violations[0]["message"]
+    assert violations[0].line == 3
+    assert "Mock()" in violations[0].message
 
 
 def test_detect_magic_mock_instantiation() -> None:
@@ -24,8 +24,8 @@ def test_foo():
 """
     violations = detect_mocks(code)
     assert len(violations) == 1
-    assert violations[0]["line"] == 3
-    assert "MagicMock()" in violations[0]["message"]
+    assert violations[0].line == 3
+    assert "MagicMock()" in violations[0].message
 
 
 def test_detect_async_mock_instantiation() -> None:
@@ -36,8 +36,8 @@ async def test_foo():
 """
     violations = detect_mocks(code)
     assert len(violations) == 1
-    assert violations[0]["line"] == 3
-    assert "AsyncMock()" in violations[0]["message"]
+    assert violations[0].line == 3
+    assert "AsyncMock()" in violations[0].message
 
 
 def test_detect_property_mock_instantiation() -> None:
@@ -48,7 +48,7 @@ def test_foo():
 """
     violations = detect_mocks(code)
     assert len(violations) == 1
-    assert "PropertyMock()" in violations[0]["message"]
+    assert "PropertyMock()" in violations[0].message
 
 
 def test_detect_patch_decorator() -> None:
@@ -60,8 +60,8 @@ def test_foo(mock_func):
 """
     violations = detect_mocks(code)
     assert len(violations) == 1
-    assert violations[0]["line"] == 2
-    assert "patch" in violations[0]["message"]
+    assert violations[0].line == 2
+    assert "patch" in violations[0].message
 
 
 def test_detect_patch_object_decorator() -> None:
@@ -73,7 +73,7 @@ def test_foo(mock_method):
 """
     violations = detect_mocks(code)
     assert len(violations) == 1
-    assert "patch" in violations[0]["message"]
+    assert "patch" in violations[0].message
 
 
 def test_detect_multiple_patch_decorators() -> None:
@@ -86,8 +86,8 @@ def test_foo(mock2, mock1):
 """
     violations = detect_mocks(code)
     assert len(violations) == 2
-    assert violations[0]["line"] == 2
-    assert violations[1]["line"] == 3
+    assert violations[0].line == 2
+    assert violations[1].line == 3
 
 
 def test_detect_patch_context_manager() -> None:
@@ -99,8 +99,8 @@ def test_foo():
 """
     violations = detect_mocks(code)
     assert len(violations) == 1
-    assert violations[0]["line"] == 3
-    assert "patch" in violations[0]["message"]
+    assert violations[0].line == 3
+    assert "patch" in violations[0].message
 
 
 def test_detect_patch_object_context_manager() -> None:
@@ -112,7 +112,7 @@ def test_foo():
 """
     violations = detect_mocks(code)
     assert len(violations) == 1
-    assert "patch" in violations[0]["message"]
+    assert "patch" in violations[0].message
 
 
 def test_detect_patch_multiple_context_manager() -> None:
@@ -124,7 +124,7 @@ def test_foo():
 """
     violations = detect_mocks(code)
     assert len(violations) == 1
-    assert "patch" in violations[0]["message"]
+    assert "patch" in violations[0].message
 
 
 def test_detect_patch_dict_context_manager() -> None:
@@ -136,7 +136,7 @@ def test_foo():
 """
     violations = detect_mocks(code)
     assert len(violations) == 1
-    assert "patch" in violations[0]["message"]
+    assert "patch" in violations[0].message
 
 
 def test_detect_manual_patch_start() -> None:
@@ -151,7 +151,7 @@ def test_foo():
     violations = detect_mocks(code)
     # Detects both the import and the patch() call
     assert len(violations) >= 1
-    assert any("patch" in v["message"] for v in violations)
+    assert any("patch" in v.message for v in violations)
 
 
 def test_detect_unittest_mock_module_usage() -> None:
@@ -164,8 +164,8 @@ def test_foo():
 """
     violations = detect_mocks(code)
     assert len(violations) == 1  # Only detects usage, not import
-    assert violations[0]["line"] == 5
-    assert "Mock()" in violations[0]["message"]
+    assert violations[0].line == 5
+    assert "Mock()" in violations[0].message
 
 
 def test_detect_legacy_mock_usage() -> None:
@@ -178,8 +178,8 @@ def test_foo():
 """
     violations = detect_mocks(code)
     assert len(violations) == 1  # Only detects usage, not import
-    assert violations[0]["line"] == 5
-    assert "Mock()" in violations[0]["message"]
+    assert violations[0].line == 5
+    assert "Mock()" in violations[0].message
 
 
 def test_detect_mixed_usage() -> None: